@@ -3,10 +3,15 @@ import dearpygui.dearpygui as dpg_org
 DpgTag = int | str
 
 from dearpygui_wrapper.base import (Container, Manager, Object,  # noqa: E402
-                                    ValueObject, get_tag)
+                                    ValueObject, add_hook, get_tag,
+                                    remove_hook)
+from dearpygui_wrapper.command_queue import CommandQueue  # noqa: E402
 from dearpygui_wrapper.node_editor import (Link, Node,  # noqa: E402
                                            NodeAttribute, NodeAttributeType,
                                            NodeEditor)
+from dearpygui_wrapper.reconciler import Reconciler  # noqa: E402
+from dearpygui_wrapper.recorder import (Event, Recorder,  # noqa: E402
+                                        Replayer, load_events)
 from dearpygui_wrapper.value import InputText, Text  # noqa: E402
 from dearpygui_wrapper.window import ViewPort, Window  # noqa: E402
 
@@ -14,6 +19,8 @@ __all__ = [
     'dpg_org',
     'DpgTag',
     'get_tag',
+    'add_hook',
+    'remove_hook',
     # base #####################################################
     'Container',
     'Manager',
@@ -31,4 +38,13 @@ __all__ = [
     'Link',
     'Node',
     'NodeEditor',
+    # command_queue ###########################################
+    'CommandQueue',
+    # reconciler ##############################################
+    'Reconciler',
+    # recorder ################################################
+    'Event',
+    'Recorder',
+    'Replayer',
+    'load_events',
 ]
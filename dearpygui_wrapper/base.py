@@ -1,10 +1,18 @@
+import inspect
 import logging
-from typing import Any, Self
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Self
 
 from dearpygui_wrapper import DpgTag, dpg_org
 
 logger = logging.getLogger('dgp_wrapper')
 
+Hook = Callable[[str, DpgTag, Any], None]
+hooks: list[Hook] = []
+hook_state = threading.local()
+frame_callbacks: dict[int, list[Callable[[], None]]] = {}
+
 
 def get_tag(id: DpgTag) -> DpgTag:
     """ Get tag of the object.
@@ -18,6 +26,132 @@ def get_tag(id: DpgTag) -> DpgTag:
     return dpg_org.get_item_alias(id) or id
 
 
+def get_arg_count(callback: Callable) -> int:
+    """ Get number of arguments DearPyGui passes to the callback.
+
+    Args:
+        callback (Callable): callback.
+
+    Returns:
+        int: number of arguments in (sender, app_data, user_data).
+    """
+    count = 0
+    for param in inspect.signature(callback).parameters.values():
+        if param.kind == param.VAR_POSITIONAL:
+            return 3
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            count += 1
+
+    return min(count, 3)
+
+
+def add_frame_callback(frame: int, callback: Callable[[], None]):
+    """ Add callback to run on the frame. Unlike `dpg_org.set_frame_callback`, several callbacks can run on the same frame.
+
+    Args:
+        frame (int): frame number.
+        callback (Callable[[], None]): callback.
+    """
+    reschedule_frame_callbacks()
+    if frame not in frame_callbacks:
+        frame_callbacks[frame] = []
+        dpg_org.set_frame_callback(frame, run_frame_callbacks, user_data=frame)
+    frame_callbacks[frame].append(callback)
+
+
+def run_frame_callbacks(sender: DpgTag, app_data: Any, frame: int):
+    """ Run callbacks added to the frame.
+
+    Args:
+        sender (DpgTag): sender tag.
+        app_data (Any): app data.
+        frame (int): frame number.
+    """
+    for callback in frame_callbacks.pop(frame, []):
+        callback()
+    reschedule_frame_callbacks()
+
+
+def reschedule_frame_callbacks():
+    """ Move callbacks of frames passed without running to the next frame.
+    They are left when `dpg_org.set_frame_callback` replaces the frame callback.
+    """
+    frame = dpg_org.get_frame_count()
+    passed = sorted(f for f in frame_callbacks if f < frame)
+    if not passed:
+        return
+    callbacks = [callback for f in passed for callback in frame_callbacks.pop(f)]
+    if frame + 1 not in frame_callbacks:
+        frame_callbacks[frame + 1] = []
+        dpg_org.set_frame_callback(frame + 1, run_frame_callbacks, user_data=frame + 1)
+    frame_callbacks[frame + 1][:0] = callbacks
+    logger.debug(f'rescheduled {len(callbacks)} frame callbacks of frames {passed}.')
+
+
+def add_hook(hook: Hook):
+    """ Add hook called on the wrapper's callback entry points and value writes.
+
+    Args:
+        hook (Hook): hook called with event name, sender tag and app data.
+    """
+    hooks.append(hook)
+
+
+def remove_hook(hook: Hook):
+    """ Remove hook.
+
+    Args:
+        hook (Hook): hook to remove.
+    """
+    hooks.remove(hook)
+
+
+def call_hooks(event: str, sender: DpgTag, app_data: Any):
+    """ Call hooks unless inside an entry point already hooked.
+
+    Args:
+        event (str): event name. 'link', 'delink', 'callback' or 'set_value'.
+        sender (DpgTag): sender tag.
+        app_data (Any): app data.
+    """
+    if getattr(hook_state, 'is_suppressed', False):
+        return
+    for hook in hooks:
+        hook(event, sender, app_data)
+
+
+@contextmanager
+def suppress_hooks() -> Iterator[None]:
+    """ Do not call hooks on the current thread within the context.
+    """
+    if getattr(hook_state, 'is_suppressed', False):
+        yield
+        return
+    hook_state.is_suppressed = True
+    try:
+        yield
+    finally:
+        hook_state.is_suppressed = False
+
+
+@contextmanager
+def hook_entry(event: str, sender: DpgTag, app_data: Any) -> Iterator[None]:
+    """ Call hooks on the entry point. Events caused inside the entry point on the same thread
+    are not hooked, since they happen again when the entry point is replayed.
+
+    Args:
+        event (str): event name. 'link', 'delink' or 'callback'.
+        sender (DpgTag): sender tag.
+        app_data (Any): app data.
+    """
+    if not hooks:
+        yield
+        return
+    call_hooks(event, sender, app_data)
+    with suppress_hooks():
+        yield
+
+
 class Object:
     is_instance = False
     generator: staticmethod
@@ -67,6 +201,75 @@ class Object:
 
 
 class ValueObject(Object):
+    def __init__(self, *args, **kwargs):
+        """ Abstract class for DearPyGui object with value.
+        """
+        super().__init__(*args, **kwargs)
+        self.__callback: Callable | None = None
+        self.__callback_arg_count = 0
+
+    def build(self, parent: Object | None, *args, **kwargs) -> Self:
+        """ Build the object.
+
+        Args:
+            parent (Object | None): parent object.
+
+        Returns:
+            Self: own instance.
+        """
+        # the native item is given a wrapper calling hooks, so `dpg_org.get_item_callback` returns it
+        # instead of the callback. use `callback` to get the callback.
+        callback = self.kwargs.get('callback')
+        if callback is not None:
+            self.__callback = callback
+            self.__callback_arg_count = get_arg_count(callback)
+            self.kwargs.update({'callback': self.__hooked_callback})
+
+        return super().build(parent, *args, **kwargs)
+
+    @property
+    def callback(self) -> Callable | None:
+        """ Get callback of the object.
+
+        Returns:
+            Callable | None: callback given to the object, not the wrapper registered to the native item.
+        """
+        return self.__callback
+
+    def set_callback(self, callback: Callable | None) -> Self:
+        """ Set callback of the built object.
+        Replacing a callback with another one does not reconfigure the native item.
+
+        Args:
+            callback (Callable | None): callback.
+
+        Returns:
+            Self: own instance.
+        """
+        if (self.__callback is None) != (callback is None):
+            dpg_org.configure_item(self.tag, callback=callback and self.__hooked_callback)
+        self.__callback = callback
+        self.__callback_arg_count = get_arg_count(callback) if callback is not None else 0
+
+        return self
+
+    def __hooked_callback(self, sender: DpgTag, app_data: Any, user_data: Any):
+        """ Callback calling hooks before the user callback.
+
+        Args:
+            sender (DpgTag): own tag.
+            app_data (Any): app data.
+            user_data (Any): user data.
+        """
+        if self.__callback is None:
+            return
+        args = (sender, app_data, user_data)[:self.__callback_arg_count]
+        if not hooks:
+            self.__callback(*args)
+            return
+        with hook_entry('callback', get_tag(sender), app_data):
+            self.__callback(*args)
+
     @property
     def value(self) -> Any:
         """ Get value of the object.
@@ -83,6 +286,8 @@ class ValueObject(Object):
         Args:
             value (Any): value to set.
         """
+        if hooks:
+            call_hooks('set_value', self.tag, value)
         dpg_org.set_value(self.tag, value)
 
     def set_values(self, values: list[Any]):
@@ -150,13 +355,58 @@ class Container(Object):
 
 
 class Manager(Container):
+    purge_interval = 0
+
     def __init__(self, *args, **kwargs):
         """ Manager class for DearPyGui object.
+
+        Set `purge_interval` to purge entries of deleted items automatically every that many frames.
         """
         super().__init__(*args, **kwargs)
         self.manager: dict[DpgTag, Object] = {}
 
     def build(self, parent: Object | None, *args, **kwargs) -> Self:
         super().build(parent, *args, manager=self.manager, **kwargs)
+        if self.purge_interval > 0:
+            self.__schedule_purge()
 
         return self
+
+    def __schedule_purge(self):
+        """ Schedule automatic purge.
+        """
+        add_frame_callback(dpg_org.get_frame_count() + self.purge_interval, self.__auto_purge)
+
+    def __auto_purge(self):
+        """ Purge and schedule next automatic purge.
+        """
+        if not dpg_org.does_item_exist(self.tag):
+            return
+        self.purge()
+        self.__schedule_purge()
+
+    def purge(self) -> dict[DpgTag, Object]:
+        """ Remove entries and children whose native item no longer exists.
+
+        Returns:
+            dict[DpgTag, Object]: purged entries.
+        """
+        tags = {tag for tag in self.manager if not dpg_org.does_item_exist(tag)}
+        purged = {tag: self.manager.pop(tag) for tag in tags}
+        for obj in [self, *self.manager.values()]:
+            if isinstance(obj, Container):
+                obj.objects = [child for child in obj.objects if getattr(child, 'tag', None) not in tags]
+        if purged:
+            logger.debug(f'{self.__class__.__name__} purged {len(purged)} entries.')
+
+        return purged
+
+    def diagnostics(self) -> dict[str, int]:
+        """ Count entries of the manager.
+
+        Returns:
+            dict[str, int]: number of live entries and leaked entries whose native item no longer exists.
+        """
+        leaked = sum(1 for tag in self.manager if not dpg_org.does_item_exist(tag))
+
+        return {'live': len(self.manager) - leaked, 'leaked': leaked}
@@ -0,0 +1,198 @@
+import logging
+import threading
+import time
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Self
+
+from dearpygui_wrapper import DpgTag, dpg_org
+from dearpygui_wrapper.base import (Container, Manager, Object, ValueObject,
+                                    add_frame_callback)
+from dearpygui_wrapper.node_editor import Link, NodeEditor
+
+logger = logging.getLogger('dgp_wrapper')
+
+
+class CommandQueue:
+    def __init__(self, *, max_commands: int = 1000, max_seconds: float = 0.004):
+        """ Queue of mutations enqueued from any thread and executed on the UI thread.
+
+        Wrapper objects are not thread-safe, so producers must only enqueue and the UI thread applies
+        the commands with `drain` (or every frame after `start`). Values set to the same object
+        before being applied are coalesced into the latest one.
+
+        Args:
+            max_commands (int, optional): Maximum number of commands executed per drain.
+            max_seconds (float, optional): Maximum seconds spent per drain.
+        """
+        self.max_commands = max_commands
+        self.max_seconds = max_seconds
+        self.__lock = threading.Lock()
+        self.__commands: deque[tuple[Callable, tuple, dict]] = deque()
+        self.__values: dict[ValueObject, Any] = {}
+        self.__is_running = False
+        self.__generation = 0
+        self.__frame = -1
+
+    def __len__(self) -> int:
+        return len(self.__commands)
+
+    def call(self, func: Callable, *args, **kwargs) -> Self:
+        """ Enqueue function call.
+
+        Args:
+            func (Callable): function to call on the UI thread.
+
+        Returns:
+            Self: own instance.
+        """
+        with self.__lock:
+            self.__commands.append((func, args, kwargs))
+
+        return self
+
+    def add(self, parent: Container, obj: Object, manager: dict[DpgTag, Object] | None = None) -> Self:
+        """ Enqueue adding and building object in the built container.
+
+        Args:
+            parent (Container): parent container.
+            obj (Object): object to add.
+            manager (dict[DpgTag, Object] | None, optional): tag manager. Defaults to the one of the nearest Manager.
+
+        Returns:
+            Self: own instance.
+        """
+        return self.call(self.__add, parent, obj, manager)
+
+    def link(self, editor: NodeEditor, attr_1: DpgTag, attr_2: DpgTag) -> Self:
+        """ Enqueue linking 2 node attributes.
+
+        Args:
+            editor (NodeEditor): node editor.
+            attr_1 (DpgTag): output attribute tag.
+            attr_2 (DpgTag): input attribute tag.
+
+        Returns:
+            Self: own instance.
+        """
+        return self.call(self.__link, editor, attr_1, attr_2)
+
+    def set_value(self, obj: ValueObject, value: Any) -> Self:
+        """ Enqueue setting value of the object. Overwrites the value not yet applied.
+
+        Args:
+            obj (ValueObject): object.
+            value (Any): value to set.
+
+        Returns:
+            Self: own instance.
+        """
+        with self.__lock:
+            if obj not in self.__values:
+                self.__commands.append((self.__set_value, (obj,), {}))
+            self.__values[obj] = value
+
+        return self
+
+    def drain(self) -> int:
+        """ Execute enqueued commands within the budget. Must be called on the UI thread.
+
+        Returns:
+            int: number of executed commands.
+        """
+        deadline = time.perf_counter() + self.max_seconds
+        count = 0
+        while count < self.max_commands and time.perf_counter() < deadline:
+            with self.__lock:
+                if not self.__commands:
+                    break
+                func, args, kwargs = self.__commands.popleft()
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                logger.exception(f'{self.__class__.__name__} failed to execute {func}.')
+            count += 1
+
+        return count
+
+    def start(self) -> Self:
+        """ Start draining every frame.
+
+        Returns:
+            Self: own instance.
+        """
+        # running unless the scheduled frame passed without draining, since the frame callback was replaced.
+        if self.__is_running and self.__frame >= dpg_org.get_frame_count():
+            return self
+        # a drain still scheduled by the previous start stops on its frame.
+        self.__is_running = True
+        self.__generation += 1
+        self.__schedule(self.__generation)
+
+        return self
+
+    def stop(self) -> Self:
+        """ Stop draining every frame.
+
+        Returns:
+            Self: own instance.
+        """
+        self.__is_running = False
+
+        return self
+
+    def __schedule(self, generation: int):
+        """ Schedule drain on the next frame.
+
+        Args:
+            generation (int): generation started.
+        """
+        self.__frame = dpg_org.get_frame_count() + 1
+        add_frame_callback(self.__frame, partial(self.__drain_frame, generation))
+
+    def __drain_frame(self, generation: int):
+        """ Drain and schedule drain on the next frame.
+
+        Args:
+            generation (int): generation started.
+        """
+        if not self.__is_running or generation != self.__generation:
+            return
+        self.drain()
+        self.__schedule(generation)
+
+    def __add(self, parent: Container, obj: Object, manager: dict[DpgTag, Object] | None):
+        """ Add and build object in the built container.
+
+        Args:
+            parent (Container): parent container.
+            obj (Object): object to add.
+            manager (dict[DpgTag, Object] | None): tag manager.
+        """
+        owner: Object | None = parent
+        while manager is None and owner is not None:
+            if isinstance(owner, Manager):
+                manager = owner.manager
+            owner = owner.parent
+        parent.add(obj)
+        obj.build(parent, manager=manager)
+
+    def __link(self, editor: NodeEditor, attr_1: DpgTag, attr_2: DpgTag):
+        """ Link 2 node attributes.
+
+        Args:
+            editor (NodeEditor): node editor.
+            attr_1 (DpgTag): output attribute tag.
+            attr_2 (DpgTag): input attribute tag.
+        """
+        Link(attr_1, attr_2).build(editor, manager=editor.manager)
+
+    def __set_value(self, obj: ValueObject):
+        """ Set the latest enqueued value of the object.
+
+        Args:
+            obj (ValueObject): object.
+        """
+        with self.__lock:
+            value = self.__values.pop(obj)
+        obj.value = value
@@ -4,6 +4,8 @@ from typing import Any, Callable, Self, cast
 
 from dearpygui_wrapper import (Container, DpgTag, Manager, Object, ValueObject,
                                dpg_org, get_tag)
+from dearpygui_wrapper.base import (add_frame_callback, hook_entry,
+                                    suppress_hooks)
 
 logger = logging.getLogger('dgp_wrapper')
 
@@ -189,6 +191,7 @@ class Node(Container):
 class NodeEditor(Manager):
     is_instance = True
     generator = staticmethod(dpg_org.add_node_editor)
+    batch_links = False
 
     def __init__(self, *, label: str | None = None, user_data: Any = None, use_internal_label: bool = True, tag: DpgTag = 0, width: int = 0, height: int = 0, parent: DpgTag = 0, before: DpgTag = 0, callback: Callable | None = None, show: bool = True, filter_key: str = '', delay_search: bool = False, tracked: bool = False, track_offset: float = 0.5, delink_callback: Callable | None = None, menubar: bool = False, minimap: bool = False, minimap_location: int = 2):
         """	 Adds a node editor.
@@ -218,6 +221,9 @@ class NodeEditor(Manager):
         kwargs.update({'callback': callback or self.__link_callback})
         kwargs.update({'delink_callback': delink_callback or self.__delink_callback})
         super().__init__(**kwargs)
+        self.__links_added: list[Link] = []
+        self.__links_removed: list[Link] = []
+        self.__flush_frame = -1
 
     def __link_callback(self, sender: DpgTag, app_data: tuple[DpgTag, DpgTag]):
         """ Callback for link.
@@ -230,11 +236,16 @@ class NodeEditor(Manager):
         sender = get_tag(sender)
         app_data = (get_tag(app_data[0]), get_tag(app_data[1]))
 
-        parent = self.manager[sender]
-        link = Link(*app_data)\
-            .build(parent, manager=self.manager)
+        with hook_entry('link', sender, app_data):
+            parent = self.manager[sender]
+            link = Link(*app_data)\
+                .build(parent, manager=self.manager)
 
-        self.link_callback(link)
+            if self.batch_links:
+                self.__links_added.append(link)
+                self.__schedule_flush()
+            else:
+                self.link_callback(link)
 
     def __delink_callback(self, sender: DpgTag, app_data: DpgTag):
         """ Callback for delink.
@@ -248,13 +259,58 @@ class NodeEditor(Manager):
         app_data = get_tag(app_data)
 
         link = cast(Link, self.manager[app_data])
-        for attr in self.manager.values():
-            if isinstance(attr, NodeAttribute) and attr.exists_link(link.tag):
-                attr.remove_link(link.tag)
-        del self.manager[link.tag]
-        dpg_org.delete_item(link.tag)
+        # link tags are generated, so record the attributes to find the link on replay.
+        with hook_entry('delink', sender, link.args):
+            for attr in (link.out_attr, link.in_attr):
+                if attr.exists_link(link.tag):
+                    attr.remove_link(link.tag)
+            del self.manager[link.tag]
+            dpg_org.delete_item(link.tag)
+
+            if self.batch_links:
+                self.__links_removed.append(link)
+                self.__schedule_flush()
+            else:
+                self.delink_callback(link)
+
+    def __schedule_flush(self):
+        """ Schedule flushing of the batched links on the next frame.
+        """
+        # the flush is lost if the frame callback is replaced, so reschedule once its frame has passed.
+        if self.__flush_frame > dpg_org.get_frame_count():
+            return
+        self.__flush_frame = dpg_org.get_frame_count() + 1
+        add_frame_callback(self.__flush_frame, self.flush_links)
+
+    def flush_links(self):
+        """ Deliver the batched link and delink events at once.
+
+        Called automatically on the frame after the events when `batch_links` is True.
+        """
+        self.__flush_frame = -1
+        if not self.__links_added and not self.__links_removed:
+            return
+        links_added, self.__links_added = self.__links_added, []
+        links_removed, self.__links_removed = self.__links_removed, []
+
+        # events caused by the batch are caused by the links and delinks hooked already.
+        with suppress_hooks():
+            self.links_callback(links_added, links_removed)
+
+    def purge(self) -> dict[DpgTag, Object]:
+        """ Remove entries and children whose native item no longer exists, and links of purged links from attributes.
+
+        Returns:
+            dict[DpgTag, Object]: purged entries.
+        """
+        purged = super().purge()
+        for tag, obj in purged.items():
+            if isinstance(obj, Link):
+                for attr in (obj.out_attr, obj.in_attr):
+                    if attr.exists_link(tag):
+                        attr.remove_link(tag)
 
-        self.delink_callback(link)
+        return purged
 
     def link_callback(self, link: Link):
         """ Callback for link.
@@ -272,6 +328,15 @@ class NodeEditor(Manager):
         """
         pass
 
+    def links_callback(self, links_added: list[Link], links_removed: list[Link]):
+        """ Callback for batched link and delink. Used instead of `link_callback` and `delink_callback` when `batch_links` is True.
+
+        Args:
+            links_added (list[Link]): links added during the frame.
+            links_removed (list[Link]): links removed during the frame.
+        """
+        pass
+
     def inject_based_on_out_attr(self, out_attr: NodeAttribute) -> Self:
         """ Inject where connected based on output attribute.
 
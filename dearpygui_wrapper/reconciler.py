@@ -0,0 +1,367 @@
+import logging
+from typing import Any
+
+from dearpygui_wrapper import DpgTag, dpg_org
+from dearpygui_wrapper.base import Container, Manager, Object, ValueObject
+
+logger = logging.getLogger('dgp_wrapper')
+
+IGNORED_KEYS = ('tag', 'parent', 'before')
+
+
+class Reconciler:
+    def __init__(self, parent: Object | None = None):
+        """ Reconcile a declared tree of objects with the tree built before.
+
+        Declare the whole tree of unbuilt objects and pass it to `reconcile` each time it changes.
+        Children are matched by tag, or by class and order when the tag is not set, and only
+        the difference is applied natively. Tagged objects are matched in the whole tree,
+        so they are moved when their parent changes. Matched objects keep the ones built before,
+        so access objects through `root` after reconciling. Callbacks of value objects are
+        replaced without native calls, so they may be declared with lambdas.
+
+        Args:
+            parent (Object | None, optional): parent object of the root.
+        """
+        self.parent = parent
+        self.root: Object | None = None
+        self.stats: dict[str, int] = {}
+        self.__specs: dict[Object, tuple[tuple, dict[str, Any]]] = {}
+        self.__owners: set[Manager] = set()
+        self.__tags: set[DpgTag] = set()
+        self.__built: dict[DpgTag, Object] = {}
+        self.__moved: set[int] = set()
+
+    def reconcile(self, desired: Object) -> dict[str, int]:
+        """ Apply the difference between the desired tree and the built tree.
+
+        Args:
+            desired (Object): root of the desired tree. Must not be built.
+
+        Returns:
+            dict[str, int]: number of native calls per operation and number of calls saved compared to rebuilding.
+        """
+        self.stats = {'created': 0, 'deleted': 0, 'moved': 0, 'configured': 0, 'set_value': 0}
+        self.__owners = set()
+        self.__tags = set(self.__tagged(desired))
+        self.__built = self.__tagged(self.root) if self.root is not None else {}
+        self.__moved = set()
+        rebuild = self.__count(desired)
+        owner = self.__owner()
+        if self.root is None:
+            self.root = self.__create(desired, self.parent, owner)
+        else:
+            rebuild += 1
+            if self.__is_compatible(self.root, desired):
+                self.__update(self.root, desired, owner)
+            else:
+                self.__delete(self.root)
+                if owner is not None:
+                    self.__owners.add(owner)
+                self.root = self.__create(desired, self.parent, owner)
+        for owner in self.__owners:
+            owner.purge()
+
+        self.stats['saved'] = rebuild - sum(self.stats.values())
+        logger.debug(f'{self.__class__.__name__} {self.stats}')
+
+        return self.stats
+
+    def __owner(self) -> Manager | None:
+        """ Get nearest manager of the parent.
+
+        Returns:
+            Manager | None: nearest manager.
+        """
+        owner = self.parent
+        while owner is not None and not isinstance(owner, Manager):
+            owner = getattr(owner, 'parent', None)
+
+        return owner
+
+    def __count(self, obj: Object) -> int:
+        """ Count objects in the tree.
+
+        Args:
+            obj (Object): root object.
+
+        Returns:
+            int: number of objects.
+        """
+        return 1 + sum(self.__count(child) for child in getattr(obj, 'objects', []))
+
+    def __tagged(self, obj: Object) -> dict[DpgTag, Object]:
+        """ Get tagged objects in the tree.
+
+        Args:
+            obj (Object): root object.
+
+        Returns:
+            dict[DpgTag, Object]: tagged objects.
+        """
+        tagged = {}
+        tag = obj.kwargs.get('tag')
+        if tag:
+            tagged[tag] = obj
+        for child in getattr(obj, 'objects', []):
+            tagged.update(self.__tagged(child))
+
+        return tagged
+
+    def __key(self, obj: Object, index: int) -> tuple[str, DpgTag | int]:
+        """ Get key of the object among its siblings.
+
+        Args:
+            obj (Object): object.
+            index (int): index among siblings of the same class.
+
+        Returns:
+            tuple[str, DpgTag | int]: key.
+        """
+        tag = obj.kwargs.get('tag')
+        return ('tag', tag) if tag else (obj.__class__.__name__, index)
+
+    def __keys(self, objects: list[Object]) -> list[tuple[str, DpgTag | int]]:
+        """ Get keys of the siblings.
+
+        Args:
+            objects (list[Object]): siblings.
+
+        Returns:
+            list[tuple[str, DpgTag | int]]: keys.
+        """
+        counts: dict[type, int] = {}
+        keys = []
+        for obj in objects:
+            index = counts.get(obj.__class__, 0)
+            counts[obj.__class__] = index + 1
+            keys.append(self.__key(obj, index))
+
+        return keys
+
+    def __is_same(self, old_value: Any, new_value: Any, old: Object, new: Object) -> bool:
+        """ Check if the values of the declared object and the built object are the same.
+
+        Args:
+            old_value (Any): value of the built object.
+            new_value (Any): value of the declared object.
+            old (Object): built object.
+            new (Object): declared object.
+
+        Returns:
+            bool: True if the values are the same, False otherwise.
+        """
+        # own methods such as NodeEditor's link callback are bound to each instance.
+        if getattr(old_value, '__self__', None) is old and getattr(new_value, '__self__', None) is new:
+            return old_value.__func__ is new_value.__func__
+
+        return old_value == new_value
+
+    def __changes(self, old: Object, new: Object) -> dict[str, Any]:
+        """ Get kwargs changed from the built object.
+
+        Args:
+            old (Object): built object.
+            new (Object): declared object.
+
+        Returns:
+            dict[str, Any]: changed kwargs.
+        """
+        old_kwargs = self.__specs[old][1]
+
+        return {
+            key: value for key, value in new.kwargs.items()
+            if key not in IGNORED_KEYS and not self.__is_same(old_kwargs.get(key), value, old, new)
+        }
+
+    def __is_compatible(self, old: Object, new: Object) -> bool:
+        """ Check if the built object can be updated to the declared object.
+
+        Args:
+            old (Object): built object.
+            new (Object): declared object.
+
+        Returns:
+            bool: True if compatible, False otherwise.
+        """
+        old_args, old_kwargs = self.__specs[old]
+
+        return old.__class__ is new.__class__ and old_args == new.args and old_kwargs.get('tag') == new.kwargs.get('tag')
+
+    def __create(self, new: Object, parent: Object | None, owner: Manager | None, before: DpgTag = 0) -> Object:
+        """ Build the declared object.
+
+        Args:
+            new (Object): declared object.
+            parent (Object | None): parent object.
+            owner (Manager | None): nearest manager.
+            before (DpgTag, optional): tag of the next sibling.
+
+        Returns:
+            Object: built object.
+        """
+        # tags still used elsewhere in the built tree must be released before build.
+        for tag in self.__tagged(new):
+            if tag in self.__built:
+                self.__delete(self.__built[tag])
+
+        self.__snapshot(new)
+        if 'before' in new.kwargs:
+            new.kwargs.update({'before': before})
+        if isinstance(new, Manager) or owner is None:
+            new.build(parent)
+        else:
+            new.build(parent, manager=owner.manager)
+        self.stats['created'] += self.__count(new)
+
+        return new
+
+    def __snapshot(self, new: Object):
+        """ Keep declared args and kwargs of the tree before build changes them.
+
+        Args:
+            new (Object): declared object.
+        """
+        self.__specs[new] = (new.args, dict(new.kwargs))
+        for child in getattr(new, 'objects', []):
+            self.__snapshot(child)
+
+    def __delete(self, old: Object):
+        """ Delete the built object.
+
+        Args:
+            old (Object): built object.
+        """
+        dpg_org.delete_item(old.tag)
+        self.stats['deleted'] += 1
+        self.__forget(old)
+
+    def __forget(self, old: Object):
+        """ Forget declared args and kwargs of the tree.
+
+        Args:
+            old (Object): built object.
+        """
+        if id(old) in self.__moved:
+            return
+        self.__specs.pop(old, None)
+        tag = old.kwargs.get('tag')
+        if tag and self.__built.get(tag) is old:
+            del self.__built[tag]
+        for child in getattr(old, 'objects', []):
+            self.__forget(child)
+
+    def __update(self, old: Object, new: Object, owner: Manager | None):
+        """ Update the built object and its children to the declared object.
+
+        Args:
+            old (Object): built object.
+            new (Object): declared object.
+            owner (Manager | None): nearest manager.
+        """
+        changes = self.__changes(old, new)
+        old_kwargs = self.__specs[old][1]
+        self.__specs[old] = (old.args, {**old_kwargs, **changes})
+        if isinstance(old, ValueObject) and 'default_value' in changes:
+            old.value = changes.pop('default_value')
+            self.stats['set_value'] += 1
+        if isinstance(old, ValueObject) and 'callback' in changes:
+            callback = changes.pop('callback')
+            if (callback is None) != (old_kwargs.get('callback') is None):
+                self.stats['configured'] += 1
+            old.set_callback(callback)
+        if changes:
+            dpg_org.configure_item(old.tag, **changes)
+            self.stats['configured'] += 1
+
+        if isinstance(old, Container) and isinstance(new, Container):
+            self.__update_children(old, new, old if isinstance(old, Manager) else owner)
+
+    def __update_children(self, old: Container, new: Container, owner: Manager | None):
+        """ Create, delete, move and update the children.
+
+        Args:
+            old (Container): built container.
+            new (Container): declared container.
+            owner (Manager | None): nearest manager.
+        """
+        deleted = self.stats['deleted']
+        old_children = dict(zip(self.__keys(old.objects), old.objects))
+        new_keys = self.__keys(new.objects)
+        for key in old_children.keys() - set(new_keys):
+            child = old_children.pop(key)
+            # moved to another parent.
+            if key[0] == 'tag' and key[1] in self.__tags:
+                continue
+            self.__delete(child)
+
+        children: list[tuple[tuple[str, DpgTag | int], Object, Object | None]] = []
+        for key, child in zip(new_keys, new.objects):
+            kept = old_children.get(key)
+            if kept is not None and not self.__is_compatible(kept, child):
+                self.__delete(kept)
+                kept = None
+            children.append((key, child, kept))
+
+        old_indexes = {id(obj): i for i, obj in enumerate(old.objects)}
+        stays = self.__stays([old_indexes[id(kept)] for _, _, kept in children if kept is not None])
+
+        before: DpgTag = 0
+        objects = []
+        for key, child, kept in reversed(children):
+            if kept is None and key[0] == 'tag':
+                # tagged object moved from another parent.
+                kept = self.__built.get(key[1])
+                if kept is not None and not self.__is_compatible(kept, child):
+                    self.__delete(kept)
+                    kept = None
+                if kept is not None:
+                    self.__moved.add(id(kept))
+                    kept.parent = old
+            if kept is None:
+                obj = self.__create(child, old, owner, before)
+            else:
+                obj = kept
+                self.__update(kept, child, owner)
+                if old_indexes.get(id(kept)) not in stays:
+                    dpg_org.move_item(kept.tag, parent=old.tag, before=before)
+                    self.stats['moved'] += 1
+            objects.append(obj)
+            before = obj.tag
+        old.objects = objects[::-1]
+
+        if owner is not None and self.stats['deleted'] > deleted:
+            self.__owners.add(owner)
+
+    def __stays(self, indexes: list[int]) -> set[int]:
+        """ Get indexes which need not move. (longest increasing subsequence)
+
+        Args:
+            indexes (list[int]): old indexes in the declared order.
+
+        Returns:
+            set[int]: indexes which need not move.
+        """
+        tails: list[int] = []
+        prevs: list[int] = []
+        for i, index in enumerate(indexes):
+            low, high = 0, len(tails)
+            while low < high:
+                mid = (low + high) // 2
+                if indexes[tails[mid]] < index:
+                    low = mid + 1
+                else:
+                    high = mid
+            prevs.append(tails[low - 1] if low else -1)
+            if low == len(tails):
+                tails.append(i)
+            else:
+                tails[low] = i
+
+        stays = set()
+        i = tails[-1] if tails else -1
+        while i >= 0:
+            stays.add(indexes[i])
+            i = prevs[i]
+
+        return stays
@@ -0,0 +1,197 @@
+import json
+import logging
+import time
+from types import ModuleType
+from typing import Any, NamedTuple, Self
+
+from dearpygui_wrapper import DpgTag, dpg_org
+from dearpygui_wrapper.base import add_hook, get_arg_count, remove_hook
+
+logger = logging.getLogger('dgp_wrapper')
+
+
+class Event(NamedTuple):
+    time: float
+    event: str
+    sender: DpgTag
+    app_data: Any
+
+
+def load_events(path: str) -> list[Event]:
+    """ Load events saved by `Recorder.save`.
+
+    Args:
+        path (str): file path.
+
+    Returns:
+        list[Event]: recorded events.
+    """
+    events = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            usec, event, sender, app_data = json.loads(line)
+            events.append(Event(usec / 1e6, event, sender, app_data))
+
+    return events
+
+
+class Recorder:
+    def __init__(self):
+        """ Record events of the wrapper's callback entry points and value writes.
+        """
+        self.events: list[Event] = []
+        self.__start = 0.0
+
+    def start(self) -> Self:
+        """ Start recording.
+
+        Returns:
+            Self: own instance.
+        """
+        self.__start = time.perf_counter()
+        add_hook(self.__hook)
+
+        return self
+
+    def stop(self) -> Self:
+        """ Stop recording.
+
+        Returns:
+            Self: own instance.
+        """
+        remove_hook(self.__hook)
+
+        return self
+
+    def save(self, path: str) -> Self:
+        """ Save recorded events as json lines of [usec, event, sender, app_data].
+
+        Args:
+            path (str): file path.
+
+        Returns:
+            Self: own instance.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for event in self.events:
+                row = [round(event.time * 1e6), event.event, event.sender, event.app_data]
+                f.write(json.dumps(row, separators=(',', ':'), default=repr) + '\n')
+
+        return self
+
+    def __hook(self, event: str, sender: DpgTag, app_data: Any):
+        """ Hook to record the event.
+
+        Args:
+            event (str): event name.
+            sender (DpgTag): sender tag.
+            app_data (Any): app data.
+        """
+        self.events.append(Event(time.perf_counter() - self.__start, event, sender, app_data))
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class Replayer:
+    def __init__(self, events: list[Event], *, realtime: bool = False, dpg: ModuleType | Any = dpg_org):
+        """ Replay recorded events against DearPyGui.
+
+        Tags are resolved on replay, so items must have the same tags (aliases) as when recorded.
+        Delinks are recorded with the attributes of the link, since link tags are generated.
+        Links of `NodeEditor.batch_links` are delivered when frames run or by `NodeEditor.flush_links`.
+
+        Args:
+            events (list[Event]): events to replay.
+            realtime (bool, optional): Replay at recorded speed. Otherwise at maximum speed.
+            dpg (ModuleType | Any, optional): DearPyGui module or stand-in providing get_item_configuration, get_item_children and set_value.
+        """
+        self.events = events
+        self.realtime = realtime
+        self.dpg = dpg
+
+    def replay(self) -> dict[str, dict[str, float]]:
+        """ Replay events.
+
+        Returns:
+            dict[str, dict[str, float]]: count, elapsed wall time (sec) of the replay, throughput (events per elapsed sec) and latency (sec) of p50, p99 and max per event.
+        """
+        latencies: dict[str, list[float]] = {}
+        start = time.perf_counter()
+        for event in self.events:
+            if self.realtime:
+                delay = start + event.time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            begin = time.perf_counter()
+            self.dispatch(event)
+            latencies.setdefault(event.event, []).append(time.perf_counter() - begin)
+        elapsed = time.perf_counter() - start
+
+        report = {}
+        for name, values in latencies.items():
+            values.sort()
+            report[name] = {
+                'count': len(values),
+                'elapsed': elapsed,
+                'throughput': len(values) / elapsed if elapsed else float('inf'),
+                'p50': values[int(len(values) * 0.5)],
+                'p99': values[min(int(len(values) * 0.99), len(values) - 1)],
+                'max': values[-1],
+            }
+            logger.info(f'{name}: {report[name]}')
+
+        return report
+
+    def dispatch(self, event: Event):
+        """ Dispatch the event as DearPyGui does.
+
+        Args:
+            event (Event): event to dispatch.
+
+        Raises:
+            ValueError: If the event is unknown.
+        """
+        if event.event == 'set_value':
+            self.dpg.set_value(event.sender, event.app_data)
+            return
+
+        config = self.dpg.get_item_configuration(event.sender)
+        match event.event:
+            case 'link':
+                callback, app_data = config['callback'], tuple(event.app_data)
+            case 'delink':
+                callback, app_data = config['delink_callback'], self.find_link(event.sender, *event.app_data)
+            case 'callback':
+                # DearPyGui updates the value before calling the callback.
+                self.dpg.set_value(event.sender, event.app_data)
+                callback, app_data = config['callback'], event.app_data
+            case _:
+                raise ValueError(f'Unknown event {event.event}.')
+
+        args = (event.sender, app_data, config.get('user_data'))
+        callback(*args[:get_arg_count(callback)])
+
+    def find_link(self, editor: DpgTag, attr_1: DpgTag, attr_2: DpgTag) -> DpgTag:
+        """ Find link between 2 node attributes.
+
+        Args:
+            editor (DpgTag): node editor tag.
+            attr_1 (DpgTag): output attribute tag.
+            attr_2 (DpgTag): input attribute tag.
+
+        Raises:
+            ValueError: If the link is not found.
+
+        Returns:
+            DpgTag: link tag.
+        """
+        for link in self.dpg.get_item_children(editor, 0):
+            config = self.dpg.get_item_configuration(link)
+            if (config['attr_1'], config['attr_2']) == (attr_1, attr_2):
+                return link
+
+        raise ValueError(f'Link between {attr_1} and {attr_2} is not found.')
@@ -0,0 +1,71 @@
+from typing import Any, Callable
+
+import pytest
+
+from dearpygui_wrapper import (Node, NodeAttribute, NodeAttributeType,
+                               NodeEditor, Text, Window, base, dpg_org)
+
+
+class Frames:
+    def __init__(self):
+        """ Stand-in of the render loop's frame counter and frame callbacks.
+        """
+        self.count = 0
+        self.callbacks: dict[int, tuple[Callable, Any]] = {}
+
+    def set_frame_callback(self, frame: int, callback: Callable, *, user_data: Any = None):
+        self.callbacks[frame] = (callback, user_data)
+
+    def render(self, count: int = 1):
+        """ Advance frames and run their callbacks.
+
+        Args:
+            count (int, optional): number of frames.
+        """
+        for _ in range(count):
+            self.count += 1
+            if self.count in self.callbacks:
+                callback, user_data = self.callbacks.pop(self.count)
+                callback(*(None, None, user_data)[:base.get_arg_count(callback)])
+
+
+@pytest.fixture
+def window():
+    dpg_org.create_context()
+    yield Window(tag='win').build()
+    base.frame_callbacks.clear()
+    dpg_org.destroy_context()
+
+
+@pytest.fixture
+def frames(monkeypatch) -> Frames:
+    frames = Frames()
+    monkeypatch.setattr(dpg_org, 'get_frame_count', lambda: frames.count)
+    monkeypatch.setattr(dpg_org, 'set_frame_callback', frames.set_frame_callback)
+    return frames
+
+
+@pytest.fixture
+def editor(window) -> NodeEditor:
+    return build_editor(window)
+
+
+def build_editor(window: Window) -> NodeEditor:
+    """ Build node editor 'ed' with output attribute 'o' and input attribute 'i'.
+    """
+    editor = NodeEditor(tag='ed')
+    editor.add(Node(tag='n1').add(NodeAttribute(tag='o', attribute_type=NodeAttributeType.OUTPUT).add(Text('out', tag='t1'))))
+    editor.add(Node(tag='n2').add(NodeAttribute(tag='i').add(Text('in', tag='t2'))))
+    return editor.build(window)
+
+
+def link(editor: NodeEditor, attr_1: str = 'o', attr_2: str = 'i'):
+    """ Link as DearPyGui does on user interaction.
+    """
+    dpg_org.get_item_callback(editor.tag)(editor.tag, (attr_1, attr_2))
+
+
+def delink(editor: NodeEditor, link_tag: Any):
+    """ Delink as DearPyGui does on user interaction.
+    """
+    dpg_org.get_item_configuration(editor.tag)['delink_callback'](editor.tag, link_tag)
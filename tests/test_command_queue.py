@@ -0,0 +1,104 @@
+import threading
+
+from dearpygui_wrapper import (CommandQueue, Node, NodeAttribute, NodeEditor,
+                               Text)
+
+
+def test_set_value_is_coalesced(editor):
+    queue = CommandQueue()
+    for i in range(100):
+        queue.set_value(editor.manager['t1'], i)
+    queue.set_value(editor.manager['t2'], 'x')
+    assert len(queue) == 2
+
+    assert queue.drain() == 2
+    assert editor.manager['t1'].value == '99'
+    assert editor.manager['t2'].value == 'x'
+
+
+def test_add_to_nested_container_and_link(editor):
+    queue = CommandQueue()
+    queue.add(editor.manager['n2'], NodeAttribute(tag='i2').add(Text('', tag='t3')))
+    queue.link(editor, 'o', 'i2')
+    queue.drain()
+
+    assert editor.manager['i2'].parent is editor.manager['n2']
+    assert editor.manager['t3'].value == ''
+    assert len(editor.manager['i2'].links) == 1
+    assert editor.manager['o'].links == editor.manager['i2'].links
+
+
+def test_budget(editor):
+    queue = CommandQueue(max_commands=3)
+    for i in range(5):
+        queue.call(lambda: None)
+
+    assert queue.drain() == 3
+    assert queue.drain() == 2
+    assert queue.drain() == 0
+
+
+def test_failed_command_does_not_stop_drain(editor):
+    queue = CommandQueue()
+    queue.call(lambda: 1 / 0)
+    queue.set_value(editor.manager['t1'], 'x')
+
+    assert queue.drain() == 2
+    assert editor.manager['t1'].value == 'x'
+
+
+def test_start_and_stop(editor, frames):
+    drains = []
+    queue = CommandQueue()
+    queue.drain = lambda: drains.append(frames.count)
+
+    queue.start()
+    queue.stop()
+    queue.start()
+    queue.start()
+    frames.render(3)
+    assert drains == [1, 2, 3]
+
+    queue.stop()
+    frames.render(2)
+    assert drains == [1, 2, 3]
+
+
+def test_producer_threads(window):
+    editor = NodeEditor(tag='ed').build(window)
+    text = Text('', tag='text').build(window)
+    queue = CommandQueue(max_commands=10000, max_seconds=1)
+
+    def produce(k: int):
+        for i in range(10000):
+            queue.set_value(text, f'{k}-{i}')
+        queue.add(editor, Node(tag=f'n{k}'))
+
+    threads = [threading.Thread(target=produce, args=(k,)) for k in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads) or len(queue):
+        queue.drain()
+
+    assert text.value.endswith('-9999')
+    assert sorted(obj.tag for obj in editor.objects) == ['n0', 'n1', 'n2', 'n3']
+    assert all(f'n{k}' in editor.manager for k in range(4))
+
+
+def test_restart_after_replaced_frame_callback(editor, frames):
+    queue = CommandQueue()
+    queue.start()
+    # user's frame callback replaces the drain.
+    frames.set_frame_callback(1, lambda: None)
+    queue.set_value(editor.manager['t1'], 'x')
+    frames.render(10)
+    assert len(queue) == 1
+
+    queue.start()
+    frames.render()
+    assert editor.manager['t1'].value == 'x'
+
+    drains = []
+    queue.drain = lambda: drains.append(frames.count)
+    frames.render(2)
+    assert drains == [frames.count - 1, frames.count]
@@ -0,0 +1,51 @@
+from conftest import link
+
+from dearpygui_wrapper import Node, NodeEditor, base, dpg_org
+from dearpygui_wrapper.base import add_frame_callback
+
+
+def test_purge(editor):
+    link(editor)
+    assert editor.diagnostics() == {'live': len(editor.manager), 'leaked': 0}
+
+    dpg_org.delete_item('n1')
+    assert editor.diagnostics()['leaked'] > 0
+
+    purged = editor.purge()
+    assert 'n1' in purged and 'o' in purged
+    assert editor.diagnostics()['leaked'] == 0
+    assert [obj.tag for obj in editor.objects] == ['n2']
+    assert editor.manager['i'].links == []
+
+
+def test_auto_purge(window, frames):
+    class Editor(NodeEditor):
+        purge_interval = 2
+
+    editor = Editor(tag='ed').add(Node(tag='n1')).build(window)
+    dpg_org.delete_item('n1')
+
+    frames.render()
+    assert editor.diagnostics()['leaked'] == 1
+    frames.render()
+    assert editor.diagnostics()['leaked'] == 0
+    assert editor.objects == []
+
+
+def test_auto_purge_after_replaced_frame_callback(window, frames):
+    class Editor(NodeEditor):
+        purge_interval = 2
+
+    editor = Editor(tag='ed').add(Node(tag='n1')).build(window)
+    dpg_org.delete_item('n1')
+    # user's frame callback replaces the purge.
+    frames.set_frame_callback(2, lambda: None)
+    frames.render(3)
+    assert editor.diagnostics()['leaked'] == 1
+
+    # any frame callback added reschedules the lost one.
+    add_frame_callback(frames.count + 5, lambda: None)
+    assert list(base.frame_callbacks) == [frames.count + 1, frames.count + 5]
+    frames.render()
+    assert editor.diagnostics()['leaked'] == 0
+    assert all(frame > frames.count for frame in base.frame_callbacks)
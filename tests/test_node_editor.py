@@ -0,0 +1,54 @@
+from conftest import delink, link
+
+from dearpygui_wrapper import Link
+
+
+def test_link_and_delink(editor):
+    links, delinks = [], []
+    editor.link_callback = links.append
+    editor.delink_callback = delinks.append
+
+    link(editor)
+    assert len(links) == 1
+    assert editor.manager['o'].links == [links[0].tag]
+    assert editor.manager['i'].links == [links[0].tag]
+
+    delink(editor, links[0].tag)
+    assert delinks == links
+    assert editor.manager['o'].links == []
+    assert editor.manager['i'].links == []
+    assert links[0].tag not in editor.manager
+
+
+def test_batch_links_flush_on_next_frame(editor, frames):
+    batches = []
+    editor.batch_links = True
+    editor.links_callback = lambda added, removed: batches.append(([x.tag for x in added], [x.tag for x in removed]))
+
+    link(editor)
+    link(editor)
+    added = [tag for tag, obj in editor.manager.items() if isinstance(obj, Link)]
+    delink(editor, added[0])
+    assert batches == []
+
+    frames.render()
+    assert batches == [(added, added[:1])]
+
+    frames.render()
+    assert len(batches) == 1
+
+
+def test_batch_links_reschedule_after_replaced_frame_callback(editor, frames):
+    batches = []
+    editor.batch_links = True
+    editor.links_callback = lambda added, removed: batches.append(len(added))
+
+    link(editor)
+    # user's frame callback replaces the flush.
+    frames.set_frame_callback(1, lambda: None)
+    frames.render()
+    assert batches == []
+
+    link(editor)
+    frames.render()
+    assert batches == [2]
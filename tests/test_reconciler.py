@@ -0,0 +1,141 @@
+from conftest import link
+
+from dearpygui_wrapper import (InputText, Node, NodeAttribute, NodeEditor,
+                               Reconciler, Text, dpg_org)
+
+
+def children(tag: str) -> list[str]:
+    """ Get native children of the item as aliases.
+    """
+    return [dpg_org.get_item_alias(child) for child in dpg_org.get_item_children(tag, 1)]
+
+
+def declare(nodes: dict[str, list[str]], values: dict[str, str] = {}) -> NodeEditor:
+    """ Declare node editor of nodes with attributes.
+    """
+    editor = NodeEditor(tag='ed')
+    for node, attrs in nodes.items():
+        obj = Node(tag=node)
+        for attr in attrs:
+            obj.add(NodeAttribute(tag=attr).add(Text(values.get(attr, ''), tag=f't_{attr}')))
+        editor.add(obj)
+    return editor
+
+
+def test_build_and_no_change(window):
+    reconciler = Reconciler(window)
+    stats = reconciler.reconcile(declare({'A': ['a1'], 'B': ['b1']}))
+    assert stats['created'] == 7
+    assert stats['saved'] == 0
+
+    stats = reconciler.reconcile(declare({'A': ['a1'], 'B': ['b1']}))
+    assert stats == {'created': 0, 'deleted': 0, 'moved': 0, 'configured': 0, 'set_value': 0, 'saved': 8}
+
+
+def test_update_values_and_configuration(window):
+    reconciler = Reconciler(window)
+    reconciler.reconcile(declare({'A': ['a1']}))
+
+    desired = declare({'A': ['a1']}, {'a1': 'value'})
+    desired.objects[0].kwargs['label'] = 'label'
+    stats = reconciler.reconcile(desired)
+    assert (stats['set_value'], stats['configured']) == (1, 1)
+    assert dpg_org.get_value('t_a1') == 'value'
+    assert dpg_org.get_item_label('A') == 'label'
+    assert reconciler.root.objects[0].objects[0].objects[0].value == 'value'
+
+
+def test_reorder(window):
+    reconciler = Reconciler(window)
+    reconciler.reconcile(declare({k: [] for k in 'ABCDE'}))
+
+    stats = reconciler.reconcile(declare({k: [] for k in 'EABDC'}))
+    assert children('ed') == list('EABDC')
+    assert [obj.tag for obj in reconciler.root.objects] == list('EABDC')
+    assert stats['moved'] == 2
+
+    stats = reconciler.reconcile(declare({k: [] for k in 'BFDE'}))
+    assert children('ed') == list('BFDE')
+    assert (stats['created'], stats['deleted'], stats['moved']) == (1, 2, 1)
+    assert not dpg_org.does_item_exist('A')
+    assert 'A' not in reconciler.root.manager
+
+
+def test_move_to_other_parent(window):
+    reconciler = Reconciler(window)
+    reconciler.reconcile(declare({'A': ['a1'], 'B': ['b1']}))
+
+    # B is reconciled before A.
+    stats = reconciler.reconcile(declare({'A': [], 'B': ['b1', 'a1']}, {'a1': 'moved'}))
+    assert children('A') == []
+    assert children('B') == ['b1', 'a1']
+    assert (stats['created'], stats['deleted'], stats['moved']) == (0, 0, 1)
+    assert dpg_org.get_value('t_a1') == 'moved'
+    a1 = reconciler.root.manager['a1']
+    assert a1.parent is reconciler.root.manager['B']
+
+    # A is reconciled after B.
+    stats = reconciler.reconcile(declare({'A': ['a1'], 'B': ['b1']}))
+    assert children('A') == ['a1']
+    assert children('B') == ['b1']
+    assert (stats['created'], stats['deleted'], stats['moved']) == (0, 0, 1)
+    assert reconciler.root.manager['a1'] is a1
+    assert [obj.tag for obj in reconciler.root.manager['A'].objects] == ['a1']
+    assert [obj.tag for obj in reconciler.root.manager['B'].objects] == ['b1']
+
+
+def test_move_to_new_parent_and_from_deleted_parent(window):
+    reconciler = Reconciler(window)
+    reconciler.reconcile(declare({'A': ['a1'], 'B': ['b1']}))
+
+    stats = reconciler.reconcile(declare({'A': [], 'B': ['b1'], 'C': ['a1']}))
+    assert children('ed') == ['A', 'B', 'C']
+    assert children('C') == ['a1']
+    assert children('A') == []
+
+    stats = reconciler.reconcile(declare({'B': ['b1', 'a1']}))
+    assert children('ed') == ['B']
+    assert children('B') == ['b1', 'a1']
+    assert stats['deleted'] == 2
+    assert dpg_org.does_item_exist('t_a1')
+
+
+def test_callback_is_replaced_without_rebuild(window):
+    values = []
+    reconciler = Reconciler(window)
+    reconciler.reconcile(InputText(tag='input', callback=lambda: values.append(1)))
+
+    stats = reconciler.reconcile(InputText(tag='input', callback=lambda: values.append(2)))
+    assert (stats['created'], stats['deleted'], stats['configured']) == (0, 0, 0)
+    dpg_org.get_item_callback('input')('input', '', None)
+    assert values == [2]
+
+    stats = reconciler.reconcile(InputText(tag='input'))
+    assert stats['configured'] == 1
+    assert dpg_org.get_item_callback('input') is None
+
+
+def test_change_root_tag(window):
+    reconciler = Reconciler(window)
+    reconciler.reconcile(Text('a', tag='A1'))
+
+    stats = reconciler.reconcile(Text('a', tag='A2'))
+    assert (stats['created'], stats['deleted']) == (1, 1)
+    assert not dpg_org.does_item_exist('A1')
+    assert dpg_org.get_value('A2') == 'a'
+    assert reconciler.root.tag == 'A2'
+
+
+def test_root_in_manager(editor):
+    reconciler = Reconciler(editor)
+    reconciler.reconcile(Node(tag='n3').add(NodeAttribute(tag='i3').add(Text('', tag='t3'))))
+    assert editor.manager['n3'] is reconciler.root
+
+    link(editor, 'o', 'i3')
+    assert len(editor.manager['i3'].links) == 1
+
+    reconciler.reconcile(Node(tag='n4'))
+    assert not dpg_org.does_item_exist('n3')
+    assert all(tag not in editor.manager for tag in ('n3', 'i3', 't3'))
+    assert editor.manager['n4'] is reconciler.root
+    assert editor.manager['o'].links == []
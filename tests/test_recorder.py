@@ -0,0 +1,116 @@
+import threading
+
+from conftest import build_editor, delink, link
+
+from dearpygui_wrapper import (InputText, Link, Recorder, Replayer, Text,
+                               dpg_org, load_events)
+
+
+def test_save_and_load(editor, tmp_path):
+    with Recorder() as recorder:
+        link(editor)
+        editor.manager['t1'].value = 'value'
+    recorder.save(str(tmp_path / 'events.jsonl'))
+
+    events = load_events(str(tmp_path / 'events.jsonl'))
+    assert [(e.event, e.sender, e.app_data) for e in events] == [('link', 'ed', ['o', 'i']), ('set_value', 't1', 'value')]
+    assert all(abs(e.time - r.time) < 1e-6 for e, r in zip(events, recorder.events))
+
+
+def test_replay_link_and_delink(window, editor, tmp_path):
+    with Recorder() as recorder:
+        link(editor)
+        link(editor)
+        delink(editor, editor.manager['o'].links[0])
+    assert recorder.events[-1].app_data == ('o', 'i')
+    recorder.save(str(tmp_path / 'events.jsonl'))
+
+    dpg_org.delete_item(editor.tag)
+    editor = build_editor(window)
+    report = Replayer(load_events(str(tmp_path / 'events.jsonl'))).replay()
+
+    assert len(editor.manager['o'].links) == 1
+    assert len([obj for obj in editor.manager.values() if isinstance(obj, Link)]) == 1
+    assert report['link']['count'] == 2
+    assert report['delink']['count'] == 1
+    assert report['link']['throughput'] == 2 / report['link']['elapsed']
+
+
+def test_nested_events_are_not_recorded(editor):
+    editor.link_callback = lambda link: editor.inject_based_on_out_attr(link.out_attr)
+
+    with Recorder() as recorder:
+        link(editor)
+    assert [e.event for e in recorder.events] == ['link']
+    assert editor.manager['t2'].value == 'out'
+
+    # replay applies the derived write again through the link callback only.
+    dpg_org.set_value('t2', '')
+    Replayer(recorder.events).replay()
+    assert editor.manager['t2'].value == 'out\nout'
+
+
+def test_callback(window):
+    values = []
+    InputText(tag='input', callback=lambda sender, app_data: values.append(app_data)).build(window)
+
+    with Recorder() as recorder:
+        dpg_org.get_item_callback('input')(dpg_org.get_alias_id('input'), 'text', None)
+    assert [(e.event, e.sender, e.app_data) for e in recorder.events] == [('callback', 'input', 'text')]
+
+    Replayer(recorder.events).replay()
+    assert values == ['text', 'text']
+
+
+def test_callback_reads_value_on_replay(window):
+    values = []
+    InputText(tag='input', callback=lambda: values.append(dpg_org.get_value('input'))).build(window)
+
+    with Recorder() as recorder:
+        # DearPyGui sets the value before calling the callback.
+        dpg_org.set_value('input', 'typed')
+        dpg_org.get_item_callback('input')(dpg_org.get_alias_id('input'), 'typed', None)
+
+    dpg_org.set_value('input', '')
+    Replayer(recorder.events).replay()
+    assert values == ['typed', 'typed']
+
+
+def test_value_write_from_other_thread_is_recorded(window):
+    text = Text('', tag='text').build(window)
+
+    def callback():
+        thread = threading.Thread(target=lambda: setattr(text, 'value', 'other'))
+        thread.start()
+        thread.join()
+        text.value = 'nested'
+
+    InputText(tag='input', callback=callback).build(window)
+    with Recorder() as recorder:
+        dpg_org.get_item_callback('input')('input', '', None)
+    assert [(e.event, e.sender) for e in recorder.events] == [('callback', 'input'), ('set_value', 'text')]
+    assert recorder.events[-1].app_data == 'other'
+
+
+def test_batched_links_callback_is_not_recorded(editor, frames):
+    editor.batch_links = True
+    editor.links_callback = lambda added, removed: editor.inject_based_on_in_attr(editor.manager['i'])
+
+    with Recorder() as recorder:
+        link(editor)
+        frames.render()
+    assert editor.manager['t2'].value == 'out'
+    assert [e.event for e in recorder.events] == ['link']
+
+
+def test_callback_without_hooks(window):
+    values = []
+
+    def callback(sender):
+        values.append(sender)
+
+    obj = InputText(tag='input', callback=callback).build(window)
+    assert obj.callback is callback
+
+    dpg_org.get_item_callback('input')('input', '', None)
+    assert values == ['input']